@@ -1,87 +1,71 @@
 """
 This script implements a SAT solver using the DIMACS format for representing Boolean formulas.
 
-The SAT solver reads a DIMACS file, extracts the clauses, and then attempts to solve the Boolean satisfiability problem 
-using a custom SAT solver (`SATSolver`). If the formula is satisfiable, it outputs a satisfying assignment of truth 
+The SAT solver (`SATSolver`) reads a DIMACS file straight into its internal clause representation, and then attempts
+to solve the Boolean satisfiability problem. If the formula is satisfiable, it outputs a satisfying assignment of truth 
 values for the variables. If unsatisfiable, it reports that the formula cannot be satisfied.
 
 The DIMACS format consists of:
 - 'c' lines for comments
 - 'p' lines indicating problem type and size
-- Clauses represented as lists of integers where each integer represents a literal.
+- Clauses represented as lists of integers where each integer represents a literal, terminated by 0.
 
  Author: Pekka Linna
  Email: pekka.j.linna@helsinki.fi
 
 Usage:
-    poetry run python satsolver.py <DIMACS-file-name>
+    poetry run python main.py <DIMACS-file-name> [backend]
 
-Where <DIMACS-file-name> is the path to the DIMACS file that contains the SAT problem.
+Where <DIMACS-file-name> is the path to the DIMACS file that contains the SAT problem, and the
+optional [backend] is one of `python` (default), `minisat22` or `glucose4`. The last two require
+the python-sat package.
 """
 import sys
 
 from satsolver import SATSolver
 
 
-def read_file_and_create_clauses(filename) -> list[list[int]]:
-    """
-    Reads a DIMACS file and converts it into a list of clauses.
-
-    This function processes the given DIMACS file, ignoring comments and problem declarations, 
-    and creates a list of clauses. Each clause is represented as a list of integers, where each 
-    integer corresponds to a literal in the clause. A positive integer represents a variable, 
-    and a negative integer represents its negation.
-
-    Parameters:
-    - filename (str): The path to the DIMACS file containing the SAT problem.
-
-    Returns:
-    - list[list[int]]: A list of clauses, each represented as a list of integers (literals).
-    """
-    clauses = []
-    
-    with open(filename, 'r') as f:
-        for line in f:
-            line = line.strip()
-
-            if line.startswith('c') or line.startswith('p') or not line:
-                continue
-            clause = list(map(int, line.split()))
-
-            if clause[-1] == 0:
-                clause.pop()
-            clauses.append(clause)
-
-    return clauses
- 
-
 def main() -> None:
     """
     Main entry point of the program.
 
-    This function handles the command-line interface, reads the DIMACS file, and passes the list 
-    of clauses to the SAT solver. It also handles displaying the results, either a satisfying 
-    assignment of variables or a message indicating that the formula is unsatisfiable.
+    This function handles the command-line interface and has the SAT solver read the DIMACS file. It also 
+    handles displaying the results, either a satisfying assignment of variables or a message indicating 
+    that the formula is unsatisfiable.
 
     Steps:
     - Checks if a DIMACS file is provided as a command-line argument.
-    - Reads the file and creates the list of clauses using the `read_file_and_create_clauses` function.
-    - Uses the `SATSolver` to attempt to solve the SAT problem.
+    - Creates the `SATSolver` from the file with `SATSolver.from_dimacs`, using the backend given as the
+      optional second argument, and attempts to solve the SAT problem.
     - Prints the result: either the satisfying assignment or a message saying the formula is unsatisfiable.
+    - An unknown backend or an unreadable formula prints its error and the usage, and a PySAT backend
+      without the python-sat package prints the installation hint, instead of a traceback.
     
     Usage:
-    - The file name is passed as a command-line argument when running the script.
+    - The file name is passed as a command-line argument when running the script, optionally followed by the backend.
     """
 
+    usage = "Usage: python main.py <DIMACS-file-name> [python|minisat22|glucose4]"
     if len(sys.argv) < 2:
-        print("Usage: python satsolver.py <DIMACS-file-name>")
+        print(usage)
         sys.exit(1)
 
     filename = sys.argv[1]
+    backend = sys.argv[2] if len(sys.argv) > 2 else "python"
     print(f"Reading DIMACS file: {filename}")
     
-    solver = SATSolver(read_file_and_create_clauses(filename))
-    sat, solution = solver.solve()
+    try:
+        solver = SATSolver.from_dimacs(filename, backend=backend)
+    except ValueError as e:
+        print(e)
+        print(usage)
+        sys.exit(1)
+
+    try:
+        sat, solution = solver.solve()
+    except ImportError as e:
+        print(e)
+        sys.exit(1)
     
     if sat:
          print("Satisfiable! Solution:")
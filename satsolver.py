@@ -1,216 +1,1162 @@
 """
-Simple SAT Solver using DPLL Algorithm
+Simple SAT Solver using the CDCL Algorithm
 
 This class implements a simple SAT (Boolean Satisfiability Problem) solver using 
-the Davis-Putnam-Logemann-Loveland (DPLL) algorithm. The SAT solver takes as input 
-a list of clauses in Conjunctive Normal Form (CNF) and determines whether the 
-propositional logic formula is satisfiable. If satisfiable, it also provides a 
-truth assignment for the variables.
+conflict-driven clause learning (CDCL), the successor of the Davis-Putnam-Logemann-Loveland
+(DPLL) algorithm. The SAT solver takes as input a list of clauses in Conjunctive Normal
+Form (CNF) and determines whether the propositional logic formula is satisfiable.
+If satisfiable, it also provides a truth assignment for the variables.
 
 Key Components:
-- **Unit Propagation**: Simplifies the formula by assigning values to variables that 
-  appear as unit clauses (clauses with a single literal).
-- **Pure Literal Elimination**: Identifies literals that appear in only one polarity 
-  (either positive or negative) and assigns them values to satisfy all their clauses.
-- **Backtracking Search**: Selects unassigned variables, assigns values, and recursively 
-  explores solutions. If a conflict is encountered, it backtracks and tries alternative assignments.
+- **Flat Clause Storage**: All clauses are stored in one contiguous integer array,
+  and a parallel array of offsets marks where each clause begins and ends. Learned
+  clauses are appended after the clauses of the input formula.
+- **Literal-indexed Tables**: Truth values and watch lists are indexed directly by the
+  literal. A table of length 2n + 1 holds literal `v` at index `v` and literal `-v` at
+  index `-v`, which Python resolves from the end of the table.
+- **Compact Storage**: Per-variable and per-clause numbers (truth values, decision levels,
+  reasons, activities, counters) are kept in typed `array.array` buffers instead of lists
+  of Python objects, and the solver uses `__slots__` instead of an attribute dictionary.
+- **VSIDS Branching**: Every variable has an activity score that is bumped whenever
+  the variable takes part in a conflict, and all scores decay over time. The solver
+  branches on the unassigned variable with the highest activity, kept in a binary
+  heap, so a decision does not scan the clauses at all. The variable gets its saved
+  phase, the value it had before the last backtrack that unassigned it.
+- **MOM Branching**: Alternatively the solver can branch on the literal occurring most
+  often in the smallest unsatisfied clauses. The clauses of the input formula that are
+  not yet satisfied are grouped into buckets by their number of unassigned literals.
+  The buckets are updated incrementally from the trail, so the smallest clauses are
+  found without rescanning the formula.
+- **Preprocessing**: Duplicate literals, tautologies, duplicate clauses and clauses
+  subsumed by shorter ones are removed from the input before the search.
+- **Watched Literals**: Every clause watches two of its literals. A clause is only
+  visited when one of its watched literals becomes false, so an assignment touches
+  only the clauses watching the falsified literal instead of the whole formula.
+  Each watch also stores a blocker literal of its clause. If the blocker is true,
+  the clause is skipped without reading its literals from the clause storage.
+- **Unit Propagation**: Assigns values to variables that are forced by clauses
+  with a single non-false literal left. The forcing clause is stored as the reason
+  of the assignment, together with the decision level it was made on.
+- **Conflict Analysis**: When a clause becomes false, its literals are resolved with
+  the reasons of the literals assigned on the current decision level until only one
+  such literal is left (the first unique implication point, 1-UIP). The result is a
+  new clause implied by the formula, which is learned so the same conflict is not
+  repeated.
+- **Backjumping**: After a conflict the search returns directly to the second highest
+  decision level of the learned clause, where the clause forces its remaining literal.
+- **Restarts**: After a number of conflicts following the Luby sequence, the search
+  returns to decision level 0 and starts over with the learned clauses, activities
+  and saved phases it has collected.
+- **Clause Deletion**: Learned clauses are rated by their literal block distance (LBD),
+  the number of different decision levels among their literals. Periodically the
+  worse half of the learned clauses is deleted to keep propagation fast.
+- **Clause Simplification**: Assignments on decision level 0 are permanent. Learned
+  clauses satisfied by them are deleted and input clauses satisfied by them are no
+  longer watched.
+- **PySAT Backends**: Optionally the formula can be handed to one of the C++ CDCL
+  solvers of the PySAT library (MiniSat 2.2 or Glucose 4) instead of the search below.
+  The library is not required for the default backend; install it with
+  `poetry add python-sat` to use the other backends.
+- **Parallel Portfolio**: `solve_portfolio` runs several differently configured searches
+  on the same formula in separate processes. The first one to finish gives the answer,
+  and the others are told to stop.
+- **Search**: Selects unassigned variables, assigns values, and explores solutions
+  iteratively. Every assignment is recorded on a trail, which is the only undo log of
+  the solver: each decision opens a new decision level by marking the current trail
+  position, and backtracking pops the trail down to such a mark.
 
 Structure:
-1. `__init__`: Initializes the solver with a list of clauses and an empty assignments dictionary.
-2. `_unit_propagate`: Simplifies the formula using unit clauses.
-3. `_pure_literal_elimination`: Simplifies the formula by assigning pure literals.
-4. `_simplify_clauses`: Updates the formula after a variable assignment.
-5. `_choose_branching_variable`: Chooses the next variable to branch on using the MOM heuristic.
-6. `_dpll`: Implements the recursive DPLL algorithm with backtracking.
-7. `solve`: Entry point for solving the SAT problem. Returns whether the formula 
+1. `__init__`: Flattens a list of clauses into the literal and offset arrays.
+2. `from_arrays`: Creates a solver from clauses that are already in flat form.
+3. `from_dimacs`: Creates a solver by reading a DIMACS file straight into flat form.
+4. `_load_clauses`: Stores the clauses and builds the watch lists and occurrence counters.
+5. `_preprocess_clauses`: Removes duplicate, tautological and subsumed input clauses.
+6. `_watch`: Adds a clause to the watch lists of its first two literals.
+7. `_assign`: Assigns a literal true and records it on the trail.
+8. `_decide`: Opens a new decision level and assigns the decision literal.
+9. `_backtrack`: Unwinds the trail back to the end of a given decision level.
+10. `_count_assignment`: Updates the occurrence counters for a new assignment.
+11. `_uncount_assignment`: Reverts the counter updates of an assignment.
+12. `_update_counters`: Applies the trail literals not yet counted to the counters.
+13. `_unit_propagate`: Propagates the assignments on the trail using the watch lists.
+14. `_bump_activity`: Increases the VSIDS activity of a variable.
+15. `_decay_activities`: Decays all VSIDS activities after a conflict.
+16. `_rebuild_order_heap`: Rebuilds the heap of unassigned variables ordered by activity.
+17. `_analyze`: Derives the 1-UIP learned clause and the backjump level from a conflict.
+18. `_learn`: Adds a learned clause and assigns the literal it forces.
+19. `_reduce_learned`: Deletes the learned clauses with the highest LBD.
+20. `_simplify_clauses`: Removes the clauses satisfied on decision level 0 from the search.
+21. `_delete_learned`: Deletes learned clauses and compacts the clause storage.
+22. `_rebuild_watches`: Rebuilds the watch lists of the clauses not yet satisfied on level 0.
+23. `_choose_vsids_literal`: Chooses the unassigned variable with the highest activity.
+24. `_choose_mom_literal`: Chooses the literal with the most occurrences in the smallest clauses.
+25. `_choose_branching_variable`: Chooses the next literal to branch on with the selected heuristic.
+26. `_input_arrays`: Returns the clauses of the input formula in flat form.
+27. `_restart`: Restarts the search from decision level 0 on the Luby schedule.
+28. `_cdcl`: Implements the CDCL search loop.
+29. `_solve_pysat`: Solves the formula with a PySAT solver.
+30. `solve`: Entry point for solving the SAT problem. Returns whether the formula 
     is satisfiable and, if so, the satisfying assignment.
+31. `solve_portfolio`: Solves the SAT problem with a portfolio of searches in parallel processes.
 
 Author: Pekka Linna
 Email: pekka.j.linna@helsinki.fi
 
 Usage:
-- Instantiate the `SATSolver` class with a list of clauses.
-- Call the `solve` method to determine satisfiability.
+- Instantiate the `SATSolver` class with a list of clauses, or read a DIMACS file
+  with `SATSolver.from_dimacs`, and optionally give a backend
+  (`"python"`, `"minisat22"` or `"glucose4"`, where `"pysat"` is short for `"minisat22"`)
+  and a branching heuristic for the Python backend (`"vsids"` or `"mom"`).
+- Call the `solve` method to determine satisfiability, or `solve_portfolio` to use
+  several processes.
 
 Example:
     clauses = [[1, -3, 4], [-1, 2, 3], [-2, -4]]
     solver = SATSolver(clauses)
     satisfiable, assignment = solver.solve()
+
+    solver = SATSolver(clauses, backend="glucose4")
+    satisfiable, assignment = solver.solve()
+
+    solver = SATSolver.from_dimacs("example.cnf")
+    satisfiable, assignment = solver.solve_portfolio(n_workers=4)
 """
-from collections import Counter
+import heapq
+import multiprocessing
+import os
+import random
+import re
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# DIMACS parsing: the '%' line that ends the formula in SATLIB files, the problem
+# line, and the comment and problem lines removed before tokenizing
+_DIMACS_END = re.compile(r'^[ \t]*%', re.MULTILINE)
+_DIMACS_HEADER = re.compile(r'^[ \t]*p[ \t]+\S+[ \t]+(\d+)', re.MULTILINE)
+_DIMACS_SKIPPED_LINE = re.compile(r'^[ \t]*[cp].*$', re.MULTILINE)
+
+# Solver class names in pysat.solvers for each PySAT backend
+PYSAT_BACKENDS = {
+    "pysat": "Minisat22",
+    "minisat22": "Minisat22",
+    "glucose4": "Glucose4",
+}
+
+# Conflicts before the first learned clause deletion, and the growth of the
+# interval after each deletion
+REDUCE_INTERVAL = 2000
+REDUCE_INCREMENT = 300
+
+BRANCHING_HEURISTICS = ("vsids", "mom")
+# Activities are divided by this after every conflict, and rescaled when they
+# grow past the limit
+VAR_DECAY = 0.95
+ACTIVITY_LIMIT = 1e100
+# Conflicts between checks of the stop event of a portfolio search
+STOP_CHECK_INTERVAL = 64
+# Conflicts between restarts are this many times the next term of the Luby sequence
+RESTART_BASE = 100
 
 
 class SATSolver:
-    def __init__(self, clauses: list) -> None:
-        self.clauses: list[list[int]] = clauses
-        self.assignments: dict[int, bool] = {}
+    # Fixed attribute slots instead of a per-instance __dict__
+    __slots__ = (
+        'backend', 'branching', 'num_vars', 'lits', 'offsets', 'lbd', 'values', 'watches',
+        'blockers', 'levels', 'reasons', 'seen', 'activity', 'var_inc', 'rng', 'phase',
+        'order_heap', 'stop_event', 'occurs', 'true_count', 'non_false', 'by_len', 'counted',
+        'units', 'has_empty_clause', 'trail', 'level_marks', 'qhead', 'conflicts',
+        'next_reduce', 'reductions', 'restarts', 'next_restart', 'simplified', 'num_original',
+    )
 
-    def _choose_branching_variable(self) -> int:
+    def __init__(self, clauses: list, backend: str = "python", branching: str = "vsids",
+                 seed: int | None = None) -> None:
+        lits = array('i')
+        offsets = array('i', [0])
+        for clause in clauses:
+            lits.extend(clause)
+            offsets.append(len(lits))
+
+        self._load_clauses(lits, offsets, 0, backend, branching, seed)
+
+    @classmethod
+    def from_arrays(cls, lits: array, offsets: array, num_vars: int = 0,
+                    backend: str = "python", branching: str = "vsids", seed: int | None = None) -> "SATSolver":
+        """
+        Create a solver from clauses that are already in the flat form used by the
+        solver, without going through a list of clauses.
+
+        :param lits: The literals of all clauses one after another.
+        :param offsets: The start of each clause in `lits`, followed by `len(lits)`.
+        :param num_vars: The number of variables, if known. Variables that occur in
+            the clauses are always counted.
+        :param backend: The backend, as for the constructor.
+        :param branching: The branching heuristic, as for the constructor.
+        :param seed: The random seed, as for the constructor.
+        :return: A new solver.
+        """
+        solver = cls.__new__(cls)
+        solver._load_clauses(lits, offsets, num_vars, backend, branching, seed)
+        return solver
+
+    @classmethod
+    def from_dimacs(cls, filename: str, backend: str = "python", branching: str = "vsids",
+                    seed: int | None = None) -> "SATSolver":
+        """
+        Create a solver directly from a DIMACS file.
+
+        Comment lines ('c') are skipped, the problem line ('p cnf <variables> <clauses>')
+        gives the number of variables, and a '%' line ends the formula as in the
+        SATLIB benchmark files. Clauses are terminated by 0 and may span lines; a last
+        clause without the terminating 0 is accepted.
+
+        The whole file is read at once. Regular expressions cut off the end of the
+        formula and remove the comment and problem lines, a single `split` tokenizes the
+        rest, and the literals are converted straight into the flat literal array. The
+        clause ends are the positions of the '0' tokens.
+
+        :param filename: The path to the DIMACS file.
+        :param backend: The backend, as for the constructor.
+        :param branching: The branching heuristic, as for the constructor.
+        :param seed: The random seed, as for the constructor.
+        :return: A new solver.
+        """
+        with open(filename, 'r') as f:
+            text = f.read()
+
+        end = _DIMACS_END.search(text)
+        if end:
+            text = text[:end.start()]
+        header = _DIMACS_HEADER.search(text)
+        num_vars = int(header.group(1)) if header else 0
+        tokens = _DIMACS_SKIPPED_LINE.sub('', text).split()
+
+        # Clause k ends at the k-th terminating 0, which has k zeros before it
+        ends = []
+        i = -1
+        try:
+            while True:
+                i = tokens.index('0', i + 1)
+                ends.append(i)
+        except ValueError:
+            pass
+
+        lits = array('i', map(int, filter('0'.__ne__, tokens)))
+        offsets = array('i', [0])
+        offsets.extend(end - k for k, end in enumerate(ends))
+        if len(lits) > offsets[-1]:
+            offsets.append(len(lits))
+
+        return cls.from_arrays(lits, offsets, num_vars, backend, branching, seed)
+
+    def _load_clauses(self, lits: array, offsets: array, num_vars: int, backend: str, branching: str,
+                      seed: int | None) -> None:
+        """
+        Initialize the solver from clauses in flat form.
+
+        The input clauses are preprocessed and copied into the solver's own literal and
+        offset arrays, except for the unit clauses, which are assigned when solving
+        starts, and empty clauses, which make the formula unsatisfiable. The watch lists
+        and occurrence counters are built in the same pass.
+
+        If a seed is given, the initial VSIDS activities get small random values, and
+        MOM breaks ties between equally frequent literals at random. The activities
+        only decide the order of the variables until the first conflicts, which is
+        enough to send differently seeded searches to different parts of the search space.
+        """
+        if backend != "python" and backend not in PYSAT_BACKENDS:
+            raise ValueError(f"Unknown backend: {backend}")
+        if branching not in BRANCHING_HEURISTICS:
+            raise ValueError(f"Unknown branching heuristic: {branching}")
+        self.backend: str = backend
+        self.branching: str = branching
+
+        self.num_vars: int = max(num_vars, max(lits, default=0), -min(lits, default=0))
+        # Clause i occupies lits[offsets[i]:offsets[i + 1]], and its two
+        # watched literals are the first two literals of that slice. When a
+        # clause is the reason of an assignment, the assigned literal is first.
+        self.lits: array = array('i')
+        self.offsets: array = array('i', [0])
+        # Literal block distance of each clause, 0 for the input clauses
+        self.lbd: array = array('i')
+        # Indexed by literal: 1 = true, -1 = false, 0 = unassigned
+        self.values: array = array('b', [0]) * (2 * self.num_vars + 1)
+        # Indexed by literal: the clauses watching the literal, and for each of them
+        # a blocker literal of the same clause, checked before the clause is visited
+        self.watches: list[list[int]] = [[] for _ in range(2 * self.num_vars + 1)]
+        self.blockers: list[list[int]] = [[] for _ in range(2 * self.num_vars + 1)]
+        # Indexed by variable: decision level and reason clause of the assignment,
+        # -1 for decisions and the unit clauses of the input
+        self.levels: array = array('i', [0]) * (self.num_vars + 1)
+        self.reasons: array = array('i', [-1]) * (self.num_vars + 1)
+        self.seen: array = array('b', [False]) * (self.num_vars + 1)
+        # VSIDS activity of each variable, and a heap of (-activity, variable)
+        # entries. An entry is stale if the activity has changed since it was
+        # pushed; every unassigned variable has one entry with its current activity.
+        self.activity: array = array('d', [0.0]) * (self.num_vars + 1)
+        self.var_inc: float = 1.0
+        # Random source of a seeded solver, None without a seed
+        self.rng: random.Random | None = random.Random(seed) if seed is not None else None
+        if self.rng is not None:
+            self.activity = array('d', (self.rng.random() * 1e-3 for _ in range(self.num_vars + 1)))
+        # Indexed by variable: the last value of the variable before it was
+        # unassigned, 1 = true, -1 = false. Decisions reuse it (phase saving).
+        self.phase: array = array('b', [-1]) * (self.num_vars + 1)
+        self.order_heap: list[tuple[float, int]] = [(-self.activity[var], var) for var in range(1, self.num_vars + 1)]
+        heapq.heapify(self.order_heap)
+        # Set by another process to stop a portfolio search
+        self.stop_event = None
+        # Occurrence lists and counters of the input clauses, indexed by literal
+        # and by clause. The unsatisfied clauses are bucketed in by_len by their
+        # number of literals that are not false.
+        self.occurs: list[list[int]] = [[] for _ in range(2 * self.num_vars + 1)]
+        self.true_count: array = array('i')
+        self.non_false: array = array('i')
+        self.by_len: dict[int, set[int]] = {}
+        # Number of trail literals already applied to the counters
+        self.counted: int = 0
+        self.units: list[int] = []
+        self.has_empty_clause: bool = False
+        self.trail: list[int] = []
+        # Trail position where each decision level starts
+        self.level_marks: list[int] = []
+        self.qhead: int = 0
+        self.conflicts: int = 0
+        self.next_reduce: int = REDUCE_INTERVAL
+        self.reductions: int = 0
+        self.restarts: int = 0
+        self.next_restart: int = RESTART_BASE * _luby(0)
+        # Trail length at the last simplification of the clause database
+        self.simplified: int = 0
+
+        for literals in self._preprocess_clauses(lits, offsets):
+            if not literals:
+                self.has_empty_clause = True
+            elif len(literals) == 1:
+                self.units.append(literals[0])
+            else:
+                index = len(self.offsets) - 1
+                self.lits.extend(literals)
+                self.offsets.append(len(self.lits))
+                self.lbd.append(0)
+                self._watch(index)
+                for literal in literals:
+                    self.occurs[literal].append(index)
+                self.true_count.append(0)
+                self.non_false.append(len(literals))
+                self.by_len.setdefault(len(literals), set()).add(index)
+
+        # Clauses from this index on are learned
+        self.num_original: int = len(self.offsets) - 1
+
+    @staticmethod
+    def _preprocess_clauses(lits: array, offsets: array) -> list[list[int]]:
+        """
+        Remove the redundant clauses of the input formula.
+
+        - Duplicate literals are removed from every clause, which also keeps a clause
+          from watching the same literal twice.
+        - Tautologies, clauses containing both a literal and its negation, are
+          always satisfied and are dropped.
+        - Of clauses with the same literals in any order only the first is kept.
+        - A clause is subsumed if all literals of a shorter clause occur in it. It is
+          satisfied whenever the shorter clause is, so it is dropped as well.
+
+        For the subsumption check, every kept clause is listed under one of its
+        literals only, the one with the fewest clauses listed so far. A clause that
+        subsumes another has all of its literals in it, so it is found by looking up
+        the literals of the longer clause.
+
+        :param lits: The literals of all clauses one after another.
+        :param offsets: The start of each clause in `lits`, followed by `len(lits)`.
+        :return: The remaining clauses in their input order, without duplicate literals.
+        """
+        clauses = []
+        seen = set()
+        for i in range(len(offsets) - 1):
+            literals = list(dict.fromkeys(lits[offsets[i]:offsets[i + 1]]))
+            key = frozenset(literals)
+            if key in seen or any(-literal in key for literal in literals):
+                continue
+            seen.add(key)
+            clauses.append((literals, key))
+
+        index: dict[int, list[frozenset[int]]] = {}
+        subsumed = set()
+        for i in sorted(range(len(clauses)), key=lambda i: len(clauses[i][0])):
+            literals, key = clauses[i]
+            if any(other <= key for literal in literals for other in index.get(literal, ())):
+                subsumed.add(i)
+                continue
+            if literals:
+                literal = min(literals, key=lambda literal: len(index.get(literal, ())))
+                index.setdefault(literal, []).append(key)
+
+        return [literals for i, (literals, _) in enumerate(clauses) if i not in subsumed]
+
+    def _watch(self, index: int) -> None:
+        """
+        Add a clause to the watch lists of its first two literals, each with the
+        other watched literal as its blocker.
+
+        :param index: Index of the clause.
+        """
+        start = self.offsets[index]
+        first, second = self.lits[start], self.lits[start + 1]
+        self.watches[first].append(index)
+        self.blockers[first].append(second)
+        self.watches[second].append(index)
+        self.blockers[second].append(first)
+
+    def _assign(self, literal: int, reason: int = -1) -> None:
+        """
+        Make the given literal true on the current decision level and push it onto
+        the trail. The literal is propagated later by `_unit_propagate`.
+
+        :param literal: The literal to assign.
+        :param reason: The clause that forced the literal, or -1 if it was not forced.
+        """
+        self.values[literal] = 1
+        self.values[-literal] = -1
+        self.levels[abs(literal)] = len(self.level_marks)
+        self.reasons[abs(literal)] = reason
+        self.trail.append(literal)
+
+    def _decide(self, literal: int) -> None:
+        """
+        Open a new decision level and assign the decision literal on it.
+        """
+        self.level_marks.append(len(self.trail))
+        self._assign(literal)
+
+    def _backtrack(self, level: int) -> None:
+        """
+        Unwind the trail back to the end of the given decision level, unassigning
+        every literal assigned on the levels above it.
+
+        The trail is the whole undo log: each literal popped from it is simply
+        unassigned, and its value is saved as the phase of its variable. Watch lists
+        need no restoring either, because a watched literal that was false is
+        unassigned again by the unwinding, so the two-watched-literal invariant
+        still holds after backtracking.
+
+        :param level: The decision level to return to. 0 keeps only the assignments
+            made before the first decision.
+        """
+        values = self.values
+        activity = self.activity
+        phase = self.phase
+        heap = self.order_heap
+        trail = self.trail
+        mark = self.level_marks[level]
+
+        while self.counted > mark:
+            self.counted -= 1
+            self._uncount_assignment(trail[self.counted])
+
+        while len(trail) > mark:
+            literal = trail.pop()
+            values[literal] = 0
+            values[-literal] = 0
+            var = abs(literal)
+            phase[var] = 1 if literal > 0 else -1
+            heapq.heappush(heap, (-activity[var], var))
+
+        del self.level_marks[level:]
+        self.qhead = min(self.qhead, mark)
+
+        # Drop the stale entries once they outnumber the variables
+        if len(heap) > 2 * self.num_vars + 100:
+            self._rebuild_order_heap()
+
+    def _count_assignment(self, literal: int) -> None:
+        """
+        Update the occurrence counters after the given literal has become true.
+
+        - Every input clause containing the literal gains a true literal. If it was
+          not satisfied before, it leaves its length bucket.
+        - Every input clause containing the negation loses a literal that is not
+          false. If it is unsatisfied, it moves to the bucket one shorter.
+        """
+        true_count = self.true_count
+        non_false = self.non_false
+        by_len = self.by_len
+
+        for i in self.occurs[literal]:
+            true_count[i] += 1
+            if true_count[i] == 1:
+                by_len[non_false[i]].discard(i)
+
+        for i in self.occurs[-literal]:
+            non_false[i] -= 1
+            if not true_count[i]:
+                by_len[non_false[i] + 1].discard(i)
+                by_len.setdefault(non_false[i], set()).add(i)
+
+    def _uncount_assignment(self, literal: int) -> None:
+        """
+        Revert the counter updates made by `_count_assignment` for the given literal.
+        Assignments must be reverted in the reverse order of the trail.
+        """
+        true_count = self.true_count
+        non_false = self.non_false
+        by_len = self.by_len
+
+        for i in self.occurs[-literal]:
+            non_false[i] += 1
+            if not true_count[i]:
+                by_len[non_false[i] - 1].discard(i)
+                by_len.setdefault(non_false[i], set()).add(i)
+
+        for i in self.occurs[literal]:
+            true_count[i] -= 1
+            if not true_count[i]:
+                by_len.setdefault(non_false[i], set()).add(i)
+
+    def _update_counters(self) -> None:
+        """
+        Apply the literals assigned since the last update to the occurrence counters.
+
+        The counters are brought up to date only when they are read, so unit
+        propagation itself stays free of counting work.
+        """
+        trail = self.trail
+        while self.counted < len(trail):
+            self._count_assignment(trail[self.counted])
+            self.counted += 1
+
+    def _bump_activity(self, var: int) -> None:
+        """
+        Increase the activity of a variable that took part in a conflict by the
+        current increment, and push its new heap entry.
+        """
+        self.activity[var] += self.var_inc
+        heapq.heappush(self.order_heap, (-self.activity[var], var))
+
+    def _decay_activities(self) -> None:
+        """
+        Decay the activities of all variables after a conflict.
+
+        Instead of multiplying every activity, the increment used by `_bump_activity`
+        is grown, which has the same effect on the order of the variables. When the
+        activities get too large for floating point, all of them are scaled down.
+        """
+        self.var_inc /= VAR_DECAY
+
+        if self.var_inc > ACTIVITY_LIMIT:
+            self.activity = array('d', (a / ACTIVITY_LIMIT for a in self.activity))
+            self.var_inc /= ACTIVITY_LIMIT
+            self._rebuild_order_heap()
+
+    def _rebuild_order_heap(self) -> None:
+        """
+        Rebuild the order heap with one current entry for every unassigned variable.
+        """
+        self.order_heap = [
+            (-self.activity[var], var)
+            for var in range(1, self.num_vars + 1)
+            if self.values[var] == 0
+        ]
+        heapq.heapify(self.order_heap)
+
+    def _choose_vsids_literal(self) -> int:
+        """
+        Choose the unassigned variable with the highest VSIDS activity.
+
+        Heap entries of assigned variables and stale entries are discarded as they are
+        popped. The variable is assigned its saved phase, the value it had when it was
+        last unassigned by backtracking, and false if it has not been assigned yet.
+
+        :return: The chosen literal, or 0 if every variable is already assigned.
+        """
+        heap = self.order_heap
+        activity = self.activity
+        values = self.values
+
+        while heap:
+            key, var = heapq.heappop(heap)
+            if values[var] == 0 and -key == activity[var]:
+                return var if self.phase[var] > 0 else -var
+        return 0
+
+    def _choose_mom_literal(self) -> int:
         """
-        Choose the next variable to branch on using the MOM (Maximum Occurrences in Minimum-sized clauses) heuristic.
-        This method selects the variable that occurs most frequently in the smallest clauses,
-        aiming to maximize the impact of the branching decision.
+        Choose the next literal to branch on using the MOM (Maximum Occurrences in Minimum-sized clauses) heuristic.
+        This method selects the literal that occurs most frequently in the smallest unsatisfied clauses,
+        aiming to maximize the impact of the branching decision. Only unassigned literals are counted.
+        The smallest clauses are read from the length buckets, so only they are scanned.
+        The occurrences are counted in a list indexed by literal.
+
+        :return: The chosen literal, or 0 if every clause of the input is already satisfied.
         """
+        self._update_counters()
+        lits = self.lits
+        offsets = self.offsets
+        values = self.values
+
         # Find the smallest clause length
-        min_length = min((len(clause) for clause in self.clauses if clause), default=0)
-        
-        # Collect all variables in the smallest clauses
-        candidates = [var for clause in self.clauses if len(clause) == min_length for var in clause]
-        
-        # Count occurrences
-        counts = Counter(candidates)
-        
-        # Return the most frequent variable
-        return max(counts, key=lambda var: counts[var])
-
-    def _unit_propagate(self):
+        lengths = [length for length, bucket in self.by_len.items() if bucket]
+        if not lengths:
+            return 0
+        min_length = min(lengths)
+
+        # Collect all unassigned literals in the smallest clauses
+        candidates = [
+            literal
+            for i in self.by_len[min_length]
+            for literal in lits[offsets[i]:offsets[i + 1]]
+            if values[literal] == 0
+        ]
+
+        # Count occurrences in a table indexed by literal
+        counts = [0] * (2 * self.num_vars + 1)
+        for literal in candidates:
+            counts[literal] += 1
+
+        # Return the most frequent literal. Ties go to the first one found, in random
+        # order if the solver is seeded.
+        if self.rng is not None:
+            self.rng.shuffle(candidates)
+        return max(candidates, key=counts.__getitem__)
+
+    def _choose_branching_variable(self) -> int:
+        """
+        Choose the next literal to branch on with the heuristic selected by `branching`.
+
+        :return: The chosen literal, or 0 if the formula is already satisfied.
+        """
+        if self.branching == "vsids":
+            return self._choose_vsids_literal()
+        return self._choose_mom_literal()
+
+    def _unit_propagate(self) -> int:
         """
         Perform unit propagation on the formula.
 
-        This method identifies and processes unit clauses (clauses containing a 
-        single literal). It assigns truth values to the variables in these unit 
-        clauses to satisfy them, simplifying the formula iteratively. The process 
-        continues until no more unit clauses are found.
-
-        - Unit clauses are extracted from the list of clauses.
-        - For each unit clause:
-            - If the literal is already assigned, it is skipped.
-            - Otherwise, the literal is assigned a truth value based on its sign.
-            - The formula is simplified by removing clauses satisfied by this 
-              literal and literals with the opposite value in other clauses.
-        - The method repeats this process until no further changes are made.
-
-        This operation helps reduce the search space in the SAT solving process 
-        and may directly resolve simple satisfiability conditions or expose conflicts.
-        """
-        changed = True
-        while changed:
-            changed = False
-            unit_clauses = [c[0] for c in self.clauses if len(c) == 1]
-            
-            for literal in unit_clauses:
-                if literal in self.assignments:
+        The trail works as the propagation queue: every literal assigned since the
+        last call is taken from the trail in order, and only the clauses watching
+        its negation are visited. For each such clause:
+            - If the blocker literal stored with the watch is true, the clause is
+              satisfied and skipped without reading the clause itself.
+            - If the other watched literal is true, the clause is satisfied and skipped.
+            - Otherwise a new non-false literal is searched from the rest of the clause
+              and the watch is moved to it.
+            - If no such literal exists, the other watched literal is the last one that
+              can satisfy the clause. If it is unassigned, it is assigned true with the
+              clause as its reason, and if it is false, a conflict has been found.
+
+        This is the hot loop of the solver. The arrays it needs are bound to local
+        variables and assignments are written inline, so the loop does no attribute
+        lookups or method calls per visited clause.
+
+        :return: The index of the conflicting clause, or -1 if no conflict was found.
+        """
+        lits = self.lits
+        offsets = self.offsets
+        values = self.values
+        watches = self.watches
+        all_blockers = self.blockers
+        levels = self.levels
+        reasons = self.reasons
+        trail = self.trail
+        qhead = self.qhead
+        level = len(self.level_marks)
+
+        while qhead < len(trail):
+            false_literal = -trail[qhead]
+            qhead += 1
+            watchers = watches[false_literal]
+            blockers = all_blockers[false_literal]
+
+            i = 0
+            while i < len(watchers):
+                # A true blocker satisfies the clause without reading its literals
+                if values[blockers[i]] == 1:
+                    i += 1
                     continue
-                self.assignments[abs(literal)] = literal > 0
-                self.clauses = self._simplify_clauses(literal)
-                changed = True
 
-    def _pure_literal_elimination(self) -> None:
+                clause = watchers[i]
+                start = offsets[clause]
+
+                # Keep the falsified watch in position start + 1
+                other = lits[start]
+                if other == false_literal:
+                    other = lits[start + 1]
+                    lits[start] = other
+                    lits[start + 1] = false_literal
+
+                if values[other] == 1:
+                    blockers[i] = other
+                    i += 1
+                    continue
+
+                for k in range(start + 2, offsets[clause + 1]):
+                    literal = lits[k]
+                    if values[literal] != -1:
+                        lits[start + 1] = literal
+                        lits[k] = false_literal
+                        watches[literal].append(clause)
+                        all_blockers[literal].append(other)
+                        watchers[i] = watchers[-1]
+                        watchers.pop()
+                        blockers[i] = blockers[-1]
+                        blockers.pop()
+                        break
+                else:
+                    if values[other] == -1:
+                        self.qhead = len(trail)
+                        return clause
+                    values[other] = 1
+                    values[-other] = -1
+                    levels[abs(other)] = level
+                    reasons[abs(other)] = clause
+                    trail.append(other)
+                    i += 1
+
+        self.qhead = qhead
+        return -1
+
+    def _analyze(self, conflict: int) -> tuple[list[int], int]:
+        """
+        Analyze a conflict and derive a learned clause using the first unique
+        implication point (1-UIP) scheme.
+
+        Starting from the conflicting clause, the literals assigned on the current
+        decision level are resolved away one at a time, walking the trail backwards
+        and replacing each literal with the other literals of its reason clause.
+        This stops when exactly one literal of the current level is left. Its
+        negation is the asserting literal of the learned clause: after backjumping
+        it is the only unassigned literal of the clause, so the clause forces it.
+        Literals assigned on level 0 are always false and are left out. Every
+        variable that takes part in the analysis gets its activity bumped.
+
+        :param conflict: The index of the clause that became false.
+        :return: The learned clause with the asserting literal first and a literal
+            of the backjump level second, and the backjump level, which is the
+            highest decision level among the other literals (0 for a unit clause).
+        """
+        lits = self.lits
+        offsets = self.offsets
+        levels = self.levels
+        reasons = self.reasons
+        seen = self.seen
+        trail = self.trail
+        level = len(self.level_marks)
+
+        learned = [0]
+        pending = 0
+        literal = 0
+        index = len(trail) - 1
+        clause = conflict
+
+        while True:
+            # The first literal of a reason clause is the literal it forced
+            start = offsets[clause] if not literal else offsets[clause] + 1
+            for other in lits[start:offsets[clause + 1]]:
+                var = abs(other)
+                if not seen[var] and levels[var] > 0:
+                    seen[var] = True
+                    self._bump_activity(var)
+                    if levels[var] == level:
+                        pending += 1
+                    else:
+                        learned.append(other)
+
+            # Continue from the latest literal of the current level in the clause
+            while not seen[abs(trail[index])]:
+                index -= 1
+            literal = trail[index]
+            index -= 1
+            seen[abs(literal)] = False
+            pending -= 1
+            if not pending:
+                break
+            clause = reasons[abs(literal)]
+
+        learned[0] = -literal
+        for other in learned:
+            seen[abs(other)] = False
+
+        if len(learned) == 1:
+            return learned, 0
+
+        # Watch a literal of the backjump level as the second literal
+        highest = max(range(1, len(learned)), key=lambda i: levels[abs(learned[i])])
+        learned[1], learned[highest] = learned[highest], learned[1]
+        return learned, levels[abs(learned[1])]
+
+    def _learn(self, learned: list[int]) -> None:
+        """
+        Add a learned clause to the clause database and assign its asserting literal.
+
+        The solver must already have backjumped, so that the first literal of the
+        clause is unassigned and every other literal is false. A unit clause is not
+        stored; its literal is assigned on level 0 without a reason.
+        """
+        if len(learned) == 1:
+            self._assign(learned[0])
+            return
+
+        index = len(self.offsets) - 1
+        self.lits.extend(learned)
+        self.offsets.append(len(self.lits))
+        self.lbd.append(len({self.levels[abs(literal)] for literal in learned}))
+        self._watch(index)
+        self._assign(learned[0], index)
+
+    def _reduce_learned(self) -> None:
+        """
+        Delete the worse half of the learned clauses, rated by their literal block
+        distance (LBD).
+
+        Clauses with an LBD of at most 2 ("glue clauses") are always kept, as are the
+        clauses that are currently the reason of an assignment.
+        """
+        lits = self.lits
+        offsets = self.offsets
+        lbd = self.lbd
+
+        def locked(i: int) -> bool:
+            literal = lits[offsets[i]]
+            return self.values[literal] == 1 and self.reasons[abs(literal)] == i
+
+        candidates = [i for i in range(self.num_original, len(offsets) - 1) if lbd[i] > 2 and not locked(i)]
+        candidates.sort(key=lambda i: lbd[i], reverse=True)
+        self._delete_learned(set(candidates[:len(candidates) // 2]))
+
+        self.reductions += 1
+        self.next_reduce = self.conflicts + REDUCE_INTERVAL + REDUCE_INCREMENT * self.reductions
+
+    def _simplify_clauses(self) -> None:
+        """
+        Simplify the clause database with the assignments of decision level 0.
+
+        Assignments on level 0 are never undone, so a clause with a true literal on
+        that level stays satisfied for the rest of the search. Satisfied learned clauses
+        are deleted and satisfied input clauses are no longer watched, which shortens
+        the watch lists walked by unit propagation. The input clauses themselves are
+        kept for the MOM counters and the PySAT backends.
+
+        The satisfied clauses are found with a single set of the true literals and one
+        `isdisjoint` call per clause.
         """
-        Perform pure literal elimination on the formula.
+        lits = self.lits
+        offsets = self.offsets
+        root_true = set(self.trail)
+
+        self._delete_learned({
+            i for i in range(self.num_original, len(offsets) - 1)
+            if not root_true.isdisjoint(lits[offsets[i]:offsets[i + 1]])
+        })
+        self.simplified = len(self.trail)
 
-        This method identifies pure literals in the formula and assigns them truth
-        values to simplify the clauses. A pure literal is a variable that appears 
-        only with a consistent sign (positive or negative) across all clauses.
+    def _delete_learned(self, deleted: set[int]) -> None:
+        """
+        Delete the given learned clauses from the clause database.
 
-        - All literals are extracted from the current set of clauses.
-        - Pure literals are determined by checking for literals whose negation 
-          does not appear in the formula.
-        - For each pure literal:
-            - If the literal is unassigned, assign it a truth value based on its sign.
-            - Simplify the formula by removing all clauses containing the pure literal.
+        The remaining learned clauses are stored again after the input clauses without
+        the deleted ones, the reasons are remapped to the new clause indices, and the
+        watch lists are rebuilt.
 
-        This process reduces the complexity of the formula and can eliminate
-        some variables and clauses directly, helping the SAT solver progress more
-        efficiently.
+        :param deleted: Indices of the learned clauses to delete.
         """
-        all_literals = [literal for clause in self.clauses for literal in clause]
-        pure_literals = [l for l in set(all_literals) if -l not in all_literals]
+        lits = self.lits
+        offsets = self.offsets
+        lbd = self.lbd
+        first = self.num_original
+
+        new_lits = lits[:offsets[first]]
+        new_offsets = offsets[:first + 1]
+        new_lbd = lbd[:first]
+        remap = {}
+        for i in range(first, len(offsets) - 1):
+            if i in deleted:
+                continue
+            remap[i] = len(new_offsets) - 1
+            new_lits.extend(lits[offsets[i]:offsets[i + 1]])
+            new_offsets.append(len(new_lits))
+            new_lbd.append(lbd[i])
+
+        self.lits = new_lits
+        self.offsets = new_offsets
+        self.lbd = new_lbd
+        self.reasons = array('i', (reason if reason < first else remap.get(reason, -1) for reason in self.reasons))
+        self._rebuild_watches()
 
-        for literal in pure_literals:
-            if abs(literal) not in self.assignments:
-                self.assignments[abs(literal)] = literal > 0
-                self.clauses = self._simplify_clauses(literal)
+    def _rebuild_watches(self) -> None:
+        """
+        Rebuild the watch lists from the first two literals of every clause, leaving
+        out the clauses that are satisfied on decision level 0.
 
-    def _simplify_clauses(self, literal) -> list[list[int]]:
+        The clauses are visited in storage order, so every watch list is sorted by
+        clause index and consecutive entries point to nearby parts of `lits`.
         """
-        Simplify the list of clauses by applying the given literal's assignment.
+        lits = self.lits
+        offsets = self.offsets
+        root_true = set(self.trail[:self.level_marks[0]] if self.level_marks else self.trail)
 
-        This function processes the current formula to simplify it based on the
-        assignment of a specific literal:
-        - If a clause contains the given literal, it is considered satisfied and removed.
-        - If a clause contains the negation of the given literal, the negation is removed
-          from the clause since it can no longer contribute to the clause's satisfaction.
-        - If removing a negated literal results in an empty clause (a conflict), an empty
-          clause is returned to signal the conflict.
+        watches = [[] for _ in range(2 * self.num_vars + 1)]
+        blockers = [[] for _ in range(2 * self.num_vars + 1)]
+        for i in range(len(offsets) - 1):
+            start = offsets[i]
+            if root_true and not root_true.isdisjoint(lits[start:offsets[i + 1]]):
+                continue
+            first, second = lits[start], lits[start + 1]
+            watches[first].append(i)
+            blockers[first].append(second)
+            watches[second].append(i)
+            blockers[second].append(first)
+        self.watches = watches
+        self.blockers = blockers
 
-        :param literal: The literal being assigned a truth value.
-        :return: A simplified list of clauses, or an empty clause if a conflict is detected.
+    def _restart(self) -> None:
         """
-        new_clauses = []
-        for clause in self.clauses:
-            if literal in clause:
-                continue 
-            new_clause = [x for x in clause if x != -literal]
+        Restart the search by backtracking to decision level 0.
 
-            if not new_clause:
-                return [[]]
-            new_clauses.append(new_clause)
-            
-        return new_clauses
+        Only the decisions and their consequences are undone. The learned clauses,
+        VSIDS activities and saved phases are kept, so the new search starts from the
+        most active variables with everything learned so far. The number of conflicts
+        until the next restart is `RESTART_BASE` times the next term of the Luby
+        sequence 1, 1, 2, 1, 1, 2, 4, 1, ...
+        """
+        if self.level_marks:
+            self._backtrack(0)
+        self.restarts += 1
+        self.next_restart = self.conflicts + RESTART_BASE * _luby(self.restarts)
 
-    def _dpll(self) -> bool:
+    def _cdcl(self) -> bool:
         """
-        Implements the DPLL (Davis-Putnam-Logemann-Loveland) algorithm to solve the SAT problem.
+        Implements the CDCL (conflict-driven clause learning) search to solve the SAT problem.
 
-        The DPLL algorithm is a recursive backtracking algorithm that:
-        1. Simplifies the formula through unit propagation and pure literal elimination.
-        2. Checks for a solution or conflicts.
-        3. Makes decisions by branching on unassigned variables and recursively attempting to solve.
+        The search is a loop that alternates between propagation and decisions:
+        - Perform unit propagation to assign truth values forced by the clauses.
+        - If a clause has all of its literals false, a conflict exists. On decision level 0
+          the conflict does not depend on any decision, so the formula is unsatisfiable and
+          the function returns `False`. Otherwise the conflict is analyzed, the solver
+          backjumps to the level given by the analysis, and the learned clause is added,
+          which forces its asserting literal. Every so often the learned clauses with the
+          highest LBD are deleted, and after a number of conflicts given by the Luby
+          sequence the search restarts.
+        - Whenever new assignments have been made on decision level 0, the clauses they
+          satisfy are removed from the search before the next decision.
+        - If the branching heuristic finds nothing left to decide (every variable is assigned
+          with VSIDS, every clause of the input is satisfied with MOM), the formula is
+          satisfiable, and the function returns `True`.
+        - Otherwise select an unassigned literal and assign it true on a new decision level.
 
-        Steps:
-        - Perform unit propagation to assign truth values to unit clauses.
-        - Eliminate pure literals to further simplify the formula.
-        - If no clauses remain, the formula is satisfiable, and the function returns `True`.
-        - If an empty clause is found, a conflict exists, and the function returns `False`.
-        - If neither condition is met, select an unassigned variable and attempt assignments (True or False).
-        - Recursively solve the simplified formula.
-        - If both branches fail, restore the previous state and backtrack.
+        If a stop event is set, it is checked every `STOP_CHECK_INTERVAL` conflicts.
 
-        :return: `True` if the formula is satisfiable, `False` otherwise.
+        :return: `True` if the formula is satisfiable, `False` otherwise, and `None` if
+            the search was stopped by the stop event.
         """
-        self._unit_propagate()
-        self._pure_literal_elimination()
+        while True:
+            conflict = self._unit_propagate()
 
-        if not self.clauses:
-            return True
+            if conflict >= 0:
+                if not self.level_marks:
+                    return False
 
-        if any(len(c) == 0 for c in self.clauses):
-            return False
-        
-        # # Choose branching variable using MOM heuristic
-        var = self._choose_branching_variable()
+                learned, backjump_level = self._analyze(conflict)
+                self._backtrack(backjump_level)
+                self._learn(learned)
+                self._decay_activities()
 
-        for value in [True, False]:
-            saved_clauses = [clause[:] for clause in self.clauses]
-            saved_assignments = self.assignments.copy()
+                self.conflicts += 1
+                if self.conflicts >= self.next_reduce:
+                    self._reduce_learned()
+                if self.conflicts >= self.next_restart:
+                    self._restart()
+                if (self.stop_event is not None and not self.conflicts % STOP_CHECK_INTERVAL
+                        and self.stop_event.is_set()):
+                    return None
+                continue
 
-            self.assignments[var] = value
-            self.clauses = self._simplify_clauses(var if value else -var)
+            if not self.level_marks and len(self.trail) > self.simplified:
+                self._simplify_clauses()
 
-            if self._dpll():
+            literal = self._choose_branching_variable()
+            if not literal:
                 return True
 
-            # Return state to previous if branching was not successful
-            self.clauses = saved_clauses
-            self.assignments = saved_assignments
+            self._decide(literal)
+
+    def _input_arrays(self) -> tuple[array, array]:
+        """
+        Return the clauses of the input formula in flat form, including the unit
+        clauses and an empty clause if the input had one. Learned clauses are left out.
+
+        :return: The literal and offset arrays, in the form taken by `from_arrays`.
+        """
+        lits = self.lits[:self.offsets[self.num_original]]
+        offsets = self.offsets[:self.num_original + 1]
+
+        for literal in self.units:
+            lits.append(literal)
+            offsets.append(len(lits))
+        if self.has_empty_clause:
+            offsets.append(len(lits))
+
+        return lits, offsets
+
+    def _solve_pysat(self) -> tuple[bool, dict[int, bool]]:
+        """
+        Solve the SAT problem with the PySAT solver selected by the backend.
+
+        The input clauses are read back from the flat literal array and passed to the
+        solver. The model returned by PySAT is a list of literals, which is converted to
+        the same variable assignment dictionary that the CDCL search returns.
+
+        :return: The same tuple as `solve`.
+        :raises ImportError: If the python-sat package is not installed.
+        """
+        try:
+            from pysat import solvers
+        except ImportError as e:
+            raise ImportError(
+                f"Backend '{self.backend}' requires python-sat, install it using `poetry add python-sat`"
+            ) from e
+
+        if self.has_empty_clause:
+            return False, None
+
+        lits, offsets = self._input_arrays()
+        clauses = [list(lits[offsets[i]:offsets[i + 1]]) for i in range(len(offsets) - 1)]
+
+        solver_class = getattr(solvers, PYSAT_BACKENDS[self.backend])
+        with solver_class(bootstrap_with=clauses) as solver:
+            if not solver.solve():
+                return False, None
+            model = solver.get_model()
 
-        return False
+        return True, {abs(literal): literal > 0 for literal in model}
 
     def solve(self) -> tuple[bool, dict[int, bool]]:
         """
-        Solve the SAT problem using the DPLL algorithm.
+        Solve the SAT problem using the CDCL algorithm.
 
-        This method wraps the internal DPLL process to determine whether the SAT problem is satisfiable.
-        It invokes the DPLL algorithm and returns the result along with the variable assignments if satisfiable.
+        This method wraps the internal CDCL search to determine whether the SAT problem is satisfiable.
+        Unit clauses of the input are assigned first on decision level 0, after which the search is invoked.
+        It returns the result along with the variable assignments if satisfiable.
+        If a PySAT backend was selected, the formula is solved with it instead.
 
         :return: 
             - A tuple where the first element is a boolean indicating satisfiability (`True` if satisfiable, `False` otherwise).
             - The second element is a dictionary mapping variables to their boolean assignments if satisfiable.
               If not satisfiable, the second element is `None`.
+            If the search was stopped by the stop event of a portfolio, both elements are `None`.
         """
-        if self._dpll():
-            return True, self.assignments
+        if self.backend != "python":
+            return self._solve_pysat()
+
+        if self.has_empty_clause:
+            return False, None
+
+        for literal in self.units:
+            if self.values[literal] == -1:
+                return False, None
+            if self.values[literal] == 0:
+                self._assign(literal)
+
+        satisfiable = self._cdcl()
+        if satisfiable is None:
+            return None, None
+
+        if satisfiable:
+            assignments = {
+                var: self.values[var] == 1
+                for var in range(1, self.num_vars + 1)
+                if self.values[var]
+            }
+            return True, assignments
         else:
             return False, None
 
+    def solve_portfolio(self, n_workers: int | None = None) -> tuple[bool, dict[int, bool]]:
+        """
+        Solve the SAT problem with a portfolio of searches running in parallel processes.
+
+        Every worker process builds its own solver for the input formula. The workers
+        alternate between the VSIDS and MOM heuristics. The first worker of each
+        heuristic runs unseeded, and every other worker gets its own random seed: a
+        seeded VSIDS worker starts from a random variable order, and a seeded MOM worker
+        breaks ties between equally frequent literals at random. On hard instances
+        differently configured searches often need very different amounts of work, so
+        the fastest of them usually finishes well before a single search would.
+
+        When the first worker finds the answer, or a worker raises an exception, a shared
+        stop event is set, which the other workers check while searching. The answer is
+        returned, and an exception is raised again in this process.
+
+        :param n_workers: The number of worker processes, by default the number of CPUs.
+            With one worker, or with a PySAT backend, the problem is solved in this process.
+        :return: The same tuple as `solve`.
+        """
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        if n_workers <= 1 or self.backend != "python":
+            return self.solve()
+
+        lits, offsets = self._input_arrays()
+        stop_event = multiprocessing.Event()
+
+        with ProcessPoolExecutor(n_workers, initializer=_init_portfolio_worker, initargs=(stop_event,)) as executor:
+            futures = [
+                executor.submit(
+                    _solve_portfolio_worker, lits, offsets, self.num_vars,
+                    "mom" if i % 2 else "vsids", i if i > 1 else None
+                )
+                for i in range(n_workers)
+            ]
+
+            # Stop the other workers also when a worker fails, so leaving the executor
+            # does not wait for their searches to finish
+            try:
+                for future in as_completed(futures):
+                    result = future.result()
+                    if result[0] is not None:
+                        return result
+            finally:
+                stop_event.set()
+
+        return None, None
+
+
+# Stop event of the portfolio worker process, set by _init_portfolio_worker
+_stop_event = None
+
+
+def _init_portfolio_worker(stop_event) -> None:
+    """
+    Store the shared stop event in a portfolio worker process.
+    """
+    global _stop_event
+    _stop_event = stop_event
+
+
+def _solve_portfolio_worker(lits: array, offsets: array, num_vars: int, branching: str,
+                            seed: int | None) -> tuple[bool, dict[int, bool]]:
+    """
+    Solve the formula given in flat form with one configuration of the portfolio.
+    The search stops early if another worker has already set the stop event.
+    """
+    solver = SATSolver.from_arrays(lits, offsets, num_vars, branching=branching, seed=seed)
+    solver.stop_event = _stop_event
+    return solver.solve()
+
+
+def _luby(i: int) -> int:
+    """
+    Return the term of the Luby sequence 1, 1, 2, 1, 1, 2, 4, 1, 1, 2, ... at index i,
+    counting from 0.
+
+    The sequence is made of blocks of sizes 1, 3, 7, ..., 2^k - 1. The last term of
+    a block is 2^(k - 1), and the terms before it repeat the previous block twice.
+    """
+    size, power = 1, 0
+    while size < i + 1:
+        power += 1
+        size = 2 * size + 1
+    while size - 1 != i:
+        size = (size - 1) >> 1
+        power -= 1
+        i %= size
+    return 2 ** power
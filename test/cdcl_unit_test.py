@@ -0,0 +1,96 @@
+import os
+import sys
+
+import pytest
+from test_util import load_cnf_files
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import satsolver
+from satsolver import SATSolver
+
+TEST_SETS = [
+    "unit-tests/sat",
+    "unit-tests/unsat",
+    "perf-tests/random-3-cnf-100-420",
+    "perf-tests/random-3-cnf-100-450",
+    "perf-tests/random-3-cnf-100-480",
+]
+
+
+def check_answer(filename, clauses, sat, sol, expected):
+    assert sat == expected, f"Test failed: {filename} answered {sat}, expected {expected}"
+    if sat:
+        for clause in clauses:
+            assert any(sol.get(abs(l)) == (l > 0) for l in clause), f"Test failed: {filename} solution does not satisfy {clause}"
+
+
+@pytest.mark.parametrize("load_cnf_files", TEST_SETS, indirect=True)
+class TestClauseDeletion:
+     def test_reduce_learned(self, load_cnf_files, monkeypatch):
+        # The answers of the default solver, which does not reach the first deletion on these sets
+        expected = {filename: SATSolver(clauses).solve()[0] for filename, clauses in load_cnf_files.items()}
+
+        monkeypatch.setattr(satsolver, "REDUCE_INTERVAL", 10)
+        monkeypatch.setattr(satsolver, "REDUCE_INCREMENT", 5)
+        reductions = 0
+        for filename, clauses in load_cnf_files.items():
+            solver = SATSolver(clauses)
+            sat, sol = solver.solve()
+            check_answer(filename, clauses, sat, sol, expected[filename])
+            reductions += solver.reductions
+
+        assert reductions > 0, "Test failed: no learned clauses were deleted"
+
+
+def check_order_heap(solver):
+    heap = solver.order_heap
+    for i in range(1, len(heap)):
+        assert heap[(i - 1) // 2] <= heap[i], "Test failed: order heap invariant broken"
+    entries = set(heap)
+    for var in range(1, solver.num_vars + 1):
+        if solver.values[var] == 0:
+            assert (-solver.activity[var], var) in entries, f"Test failed: no current heap entry for {var}"
+
+
+@pytest.mark.parametrize("load_cnf_files", TEST_SETS, indirect=True)
+class TestActivityRescale:
+     def test_rescale_activities(self, load_cnf_files, monkeypatch):
+        expected = {filename: SATSolver(clauses).solve()[0] for filename, clauses in load_cnf_files.items()}
+
+        monkeypatch.setattr(satsolver, "ACTIVITY_LIMIT", 10.0)
+        decay_activities = SATSolver._decay_activities
+        rescales = 0
+
+        def checked_decay_activities(solver):
+            nonlocal rescales
+            var_inc = solver.var_inc
+            activity = solver.activity[:]
+            decay_activities(solver)
+            if solver.var_inc < var_inc:
+                rescales += 1
+                assert list(solver.activity) == [a / satsolver.ACTIVITY_LIMIT for a in activity]
+                check_order_heap(solver)
+
+        monkeypatch.setattr(SATSolver, "_decay_activities", checked_decay_activities)
+        for filename, clauses in load_cnf_files.items():
+            solver = SATSolver(clauses)
+            sat, sol = solver.solve()
+            check_answer(filename, clauses, sat, sol, expected[filename])
+
+        assert rescales > 0, "Test failed: the activities were never rescaled"
+
+
+def test_phase_saving():
+    solver = SATSolver([[1, 2], [-1, 3], [-2, -3, 4]])
+    # Decide against the default polarity, which is false
+    solver._decide(1)
+    assert solver._unit_propagate() == -1
+    assert solver.values[3] == 1
+    solver._backtrack(0)
+
+    assert solver.values[1] == 0 and solver.values[3] == 0
+    assert solver.phase[1] == 1 and solver.phase[3] == 1
+    # Variables that were never assigned keep the default polarity
+    assert solver.phase[2] == -1
+    # All activities are equal, so the first variable is chosen again with its saved phase
+    assert solver._choose_vsids_literal() == 1
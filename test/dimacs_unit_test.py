@@ -0,0 +1,56 @@
+import os
+import sys
+
+import pytest
+from test_util import load_cnf_files
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from satsolver import SATSolver
+
+
+@pytest.mark.parametrize("load_cnf_files", ["unit-tests/sat"], indirect=True)
+class TestDimacsSAT:
+     def test_from_dimacs_sat(self, load_cnf_files):
+        for filename, clauses in load_cnf_files.items():
+            solver = SATSolver.from_dimacs(os.path.join("unit-tests/sat", filename))
+            sat, sol = solver.solve()
+            assert sat, f"Test failed: {filename} is UNSATISFIABLE but expected SATISFIABLE"
+            for clause in clauses:
+                assert any(sol.get(abs(l)) == (l > 0) for l in clause), f"Test failed: {filename} solution does not satisfy {clause}"
+
+
+@pytest.mark.parametrize("load_cnf_files", ["unit-tests/unsat"], indirect=True)
+class TestDimacsUNSAT:
+     def test_from_dimacs_unsat(self, load_cnf_files):
+        for filename in load_cnf_files.keys():
+            solver = SATSolver.from_dimacs(os.path.join("unit-tests/unsat", filename))
+            sat, sol = solver.solve()
+            assert not sat, f"Test failed: {filename} is SATISFIABLE but expected UNSATISFIABLE"
+
+
+def test_from_dimacs_format(tmp_path):
+    cnf_file = tmp_path / "format.cnf"
+    cnf_file.write_text(
+        "c clauses may span lines\n"
+        "p cnf 4 3\n"
+        "1 -2\n"
+        "  3 0 -1 0\n"
+        "2 -3 0\n"
+        "%\n"
+        "0\n"
+    )
+    solver = SATSolver.from_dimacs(str(cnf_file))
+    assert solver.num_vars == 4
+    sat, sol = solver.solve()
+    assert sat
+    assert sol[1] is False
+    assert sol[2] or not sol[3]
+    assert not sol[2] or sol[3]
+
+
+def test_from_dimacs_empty_clause(tmp_path):
+    cnf_file = tmp_path / "empty.cnf"
+    cnf_file.write_text("p cnf 2 2\n1 2 0 0\n")
+    solver = SATSolver.from_dimacs(str(cnf_file))
+    sat, sol = solver.solve()
+    assert not sat
@@ -0,0 +1,58 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+from test_util import load_cnf_files
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from satsolver import STOP_CHECK_INTERVAL, SATSolver
+
+
+@pytest.mark.parametrize("load_cnf_files", ["unit-tests/sat"], indirect=True)
+class TestPortfolioSAT:
+     def test_portfolio_sat(self, load_cnf_files):
+        print("Executing satisfiable testset with a portfolio of 2 workers:")
+        for filename, clauses in load_cnf_files.items():
+            solver = SATSolver(clauses)
+            start_time = time.time()
+            sat, sol = solver.solve_portfolio(n_workers=2)
+            execution_time = time.time() - start_time
+            print(f"{'Satisfiable' if sat else 'Unsatisfiable'}, execution time for {filename}: {execution_time:.11f} seconds")
+            assert sat, f"Test failed: {filename} is UNSATISFIABLE but expected SATISFIABLE"
+            for clause in clauses:
+                assert any(sol.get(abs(l)) == (l > 0) for l in clause), f"Test failed: {filename} solution does not satisfy {clause}"
+
+
+@pytest.mark.parametrize("load_cnf_files", ["unit-tests/unsat"], indirect=True)
+class TestPortfolioUNSAT:
+     def test_portfolio_unsat(self, load_cnf_files):
+        print("Executing unsatisfiable testset with a portfolio of 2 workers:")
+        for filename, clauses in load_cnf_files.items():
+            solver = SATSolver(clauses)
+            start_time = time.time()
+            sat, sol = solver.solve_portfolio(n_workers=2)
+            execution_time = time.time() - start_time
+            print(f"{'Satisfiable' if sat else 'Unsatisfiable'}, execution time for {filename}: {execution_time:.11f} seconds")
+            assert sat is False, f"Test failed: {filename} is SATISFIABLE but expected UNSATISFIABLE"
+
+
+def test_seeded_mom_searches_differ():
+    filename = "perf-tests/random-3-cnf-100-480/10_100_480.cnf"
+    conflicts = set()
+    for seed in (None, 1, 3, 5, 7):
+        solver = SATSolver.from_dimacs(filename, branching="mom", seed=seed)
+        sat, sol = solver.solve()
+        assert sat is False
+        conflicts.add(solver.conflicts)
+    assert len(conflicts) > 1
+
+
+def test_stop_event_stops_search():
+    solver = SATSolver.from_dimacs("perf-tests/random-3-cnf-100-480/10_100_480.cnf")
+    solver.stop_event = threading.Event()
+    solver.stop_event.set()
+    sat, sol = solver.solve()
+    assert sat is None and sol is None
+    assert solver.conflicts == STOP_CHECK_INTERVAL
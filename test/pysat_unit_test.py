@@ -0,0 +1,41 @@
+import os
+import sys
+import time
+
+import pytest
+from test_util import load_cnf_files
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from satsolver import SATSolver
+
+pytest.importorskip("pysat")
+
+
+@pytest.mark.parametrize("backend", ["minisat22", "glucose4"])
+@pytest.mark.parametrize("load_cnf_files", ["unit-tests/sat"], indirect=True)
+class TestPySATBackendSAT:
+     def test_pysat_sat(self, load_cnf_files, backend):
+        print(f"Executing satisfiable testset with backend {backend}:")
+        for filename, clauses in load_cnf_files.items():
+            solver = SATSolver(clauses, backend=backend)
+            start_time = time.time()
+            sat, sol = solver.solve()
+            execution_time = time.time() - start_time
+            print(f"{'Satisfiable' if sat else 'Unsatisfiable'}, execution time for {filename}: {execution_time:.11f} seconds")
+            assert sat, f"Test failed: {filename} is UNSATISFIABLE but expected SATISFIABLE"
+            for clause in clauses:
+                assert any(sol.get(abs(l)) == (l > 0) for l in clause), f"Test failed: {filename} solution does not satisfy {clause}"
+
+
+@pytest.mark.parametrize("backend", ["minisat22", "glucose4"])
+@pytest.mark.parametrize("load_cnf_files", ["unit-tests/unsat"], indirect=True)
+class TestPySATBackendUNSAT:
+     def test_pysat_unsat(self, load_cnf_files, backend):
+        print(f"Executing unsatisfiable testset with backend {backend}:")
+        for filename, clauses in load_cnf_files.items():
+            solver = SATSolver(clauses, backend=backend)
+            start_time = time.time()
+            sat, sol = solver.solve()
+            execution_time = time.time() - start_time
+            print(f"{'Satisfiable' if sat else 'Unsatisfiable'}, execution time for {filename}: {execution_time:.11f} seconds")
+            assert not sat, f"Test failed: {filename} is SATISFIABLE but expected UNSATISFIABLE"
@@ -6,7 +6,7 @@ import pytest
 from test_util import load_cnf_files
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from satsolver import SATSolver
+from satsolver import SATSolver, _luby
 
 
 @pytest.mark.parametrize("load_cnf_files", ["unit-tests/sat"], indirect=True)
@@ -34,4 +34,33 @@ class TestUnitSAT:
         average_time = total_time / num_of_tests
         print()
         print(f"Average execution time for satisfiable testset: {average_time:11f} seconds")
-        
\ No newline at end of file
+
+
+@pytest.mark.parametrize("branching", ["vsids", "mom"])
+def test_deep_decision_stack(branching):
+    # Every pair needs its own decision, so the search goes deeper than the recursion limit
+    pairs = sys.getrecursionlimit() + 500
+    clauses = []
+    for x in range(1, 2 * pairs, 2):
+        clauses.append([x, x + 1])
+        clauses.append([-x, -(x + 1)])
+    sat, sol = SATSolver(clauses, branching=branching).solve()
+    assert sat
+    for clause in clauses:
+        assert any(sol[abs(l)] == (l > 0) for l in clause)
+
+
+def test_preprocess_clauses():
+    clauses = [[1, 2, 3], [3, 2, 1], [1, -1, 2], [2, 2, -3], [2, -3, 4], [-1, 4]]
+    solver = SATSolver(clauses)
+    # The duplicate, the tautology and the clause subsumed by [2, -3] are removed
+    assert solver.num_original == 3
+    sat, sol = solver.solve()
+    assert sat
+    for clause in clauses:
+        if not any(-l in clause for l in clause):
+            assert any(sol[abs(l)] == (l > 0) for l in clause)
+
+
+def test_luby_sequence():
+    assert [_luby(i) for i in range(15)] == [1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8]
@@ -1,12 +1,34 @@
 import os
+import pickle
 
 import pytest
 
+# Name of the cache file of parsed clauses, written to each test directory
+CACHE_FILE = ".cnf_cache.pickle"
+
+
+def parse_cnf_file(filepath):
+    """
+    Parse a .cnf-file into a list of clauses, one clause per line.
+    """
+    clauses = []
+    with open(filepath, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith('c') or line.startswith('p') or not line:
+                continue
+            clause = list(map(int, line.split()))
+            if clause[-1] == 0:
+                clause.pop()
+            clauses.append(clause)
+    return clauses
+
 
 @pytest.fixture(scope="session")
 def load_cnf_files(request):
     """
     Fixture that reads all .cnf files from the 'unit-tests' directory and parses them into clauses.
+    The parsed clauses are cached on disk between test sessions, keyed by the modification time of each file.
     """
     print("\nLoad all .cnf-files.")
     #test_dir = "unit-tests" 
@@ -16,23 +38,46 @@ def load_cnf_files(request):
     if not os.path.exists(test_dir):
         raise FileNotFoundError(f"Directory {test_dir} not found.")
 
-    # Read all .cnf-files and parse them into clauses
+    # Read all .cnf-files and parse them into clauses. Parsed files are cached in the test
+    # directory and only parsed again if their modification time has changed.
+    cache_path = os.path.join(test_dir, CACHE_FILE)
+    cache = {}
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'rb') as f:
+                cache = pickle.load(f)
+        except Exception:
+            cache = {}
+    # A cache in any other layout, e.g. from an older version, is ignored
+    if not isinstance(cache, dict) or not all(
+        isinstance(entry, tuple) and len(entry) == 2 and isinstance(entry[0], int) and isinstance(entry[1], list)
+        for entry in cache.values()
+    ):
+        cache = {}
+
     cnf_data = {}
+    new_cache = {}
+    changed = False
     for filename in os.listdir(test_dir):
         if filename.endswith(".cnf"):
             filepath = os.path.join(test_dir, filename)
-            clauses = []
-            with open(filepath, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith('c') or line.startswith('p') or not line:
-                        continue
-                    clause = list(map(int, line.split()))
-                    if clause[-1] == 0:
-                        clause.pop()
-                    clauses.append(clause)
+            mtime = os.stat(filepath).st_mtime_ns
+            cached = cache.get(filename)
+            if cached is not None and cached[0] == mtime:
+                clauses = cached[1]
+            else:
+                clauses = parse_cnf_file(filepath)
+                changed = True
+            new_cache[filename] = (mtime, clauses)
             cnf_data[filename] = clauses
 
+    if changed or len(new_cache) != len(cache):
+        try:
+            with open(cache_path, 'wb') as f:
+                pickle.dump(new_cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+
     if not cnf_data:
         raise FileNotFoundError(f"No .cnf files found in directory {test_dir}.")
 